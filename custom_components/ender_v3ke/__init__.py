@@ -2,22 +2,35 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 import math
 import os
+import random
 import time
+from dataclasses import asdict, dataclass
 from typing import Any
 
 from aiohttp import ClientError
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.components import mqtt
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+try:
+    import websockets
+except ImportError:  # pragma: no cover - installed from the manifest requirements
+    websockets = None
+
 from .const import (
     CONF_ENABLE_MQTT,
     CONF_EXPOSED_IMAGE_PATH,
@@ -34,13 +47,53 @@ from .const import (
     DEFAULT_PUBLISH_INTERVAL,
     DOMAIN,
     IMAGE_ALLOWED_CONTENT_TYPES,
-    IMAGE_CHUNK_BYTES,
+    WS_RECONNECT_COOLDOWN,
+    WS_RECONNECT_JITTER,
+    WS_RECONNECT_MAX_DELAY,
+    WS_RECONNECT_MAX_RETRIES,
+    WS_RECONNECT_MIN_DELAY,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_INF = math.inf
+# orjson only encodes integers within the signed 64-bit range.
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+# Both encoders accept PrinterPayload directly: orjson serialises dataclasses
+# natively and the stdlib encoder falls back to ``asdict``.
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+    # Reuse one compact encoder rather than configuring a new one per call.
+    _json_dumps = json.JSONEncoder(
+        separators=(",", ":"), ensure_ascii=False, default=asdict
+    ).encode
+
+# Printer telemetry keys merged into the cached state.
+_PRINTER_KEYS: tuple[str, ...] = (
+    "printProgress",
+    "layer",
+    "TotalLayer",
+    "printJobTime",
+    "printLeftTime",
+    "printFileName",
+    "nozzleTemp",
+    "bedTemp0",
+    "usedMaterialLength",
+)
+_PRINTER_KEY_SET: frozenset[str] = frozenset(_PRINTER_KEYS)
+# Quoted keys used to skip decoding frames that carry none of the telemetry.
+_PRINTER_KEY_NEEDLES: tuple[str, ...] = tuple(f'"{key}"' for key in _PRINTER_KEYS)
+_PRINTER_KEY_NEEDLES_BYTES: tuple[bytes, ...] = tuple(
+    needle.encode() for needle in _PRINTER_KEY_NEEDLES
+)
+
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the integration from YAML (not supported)."""
@@ -58,54 +111,112 @@ def _safe_str(value: Any, default: str = "") -> str:
 
 
 def _safe_float(value: Any, default: float = 0.0) -> float:
-    if value is None:
+    # Exact type checks keep the common float case off the conversion path;
+    # ``result == result`` rejects NaN without a function call.
+    if type(value) is float:
+        result = value
+    elif value is None:
         return default
-    if isinstance(value, (int, float)):
-        result = float(value)
     else:
         try:
-            result = float(str(value).strip())
-        except (TypeError, ValueError):
+            result = float(value)
+        except (TypeError, ValueError, OverflowError):
             return default
-    if math.isnan(result) or math.isinf(result):
-        return default
-    return result
+    if result == result and -_INF < result < _INF:
+        return result
+    return default
 
 
 def _safe_int(value: Any, default: int = 0) -> int:
-    if value is None:
-        return default
-    if isinstance(value, bool):
-        return default
-    if isinstance(value, int):
-        return value
-    if isinstance(value, float):
-        if math.isnan(value) or math.isinf(value):
+    value_type = type(value)
+    if value_type is int:
+        result = value
+    elif value_type is float:
+        if not (value == value and -_INF < value < _INF):
             return default
-        return int(value)
-    try:
-        return int(float(str(value).strip()))
-    except (TypeError, ValueError):
+        result = int(value)
+    elif value is None or value_type is bool:
         return default
+    else:
+        try:
+            result = int(float(value))
+        except (TypeError, ValueError, OverflowError):
+            return default
+    if _INT64_MIN <= result <= _INT64_MAX:
+        return result
+    return default
 
 
 def _clamp(value: float, minimum: float, maximum: float) -> float:
     return max(minimum, min(maximum, value))
 
 
-class EnderStateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Coordinator backing the Ender V3KE sensors."""
+@dataclass(frozen=True, slots=True)
+class PrinterPayload:
+    """Sanitised printer telemetry shared by the sensors and MQTT.
+
+    Instances are immutable, so the memoised payload, the pending MQTT
+    payload and the coordinator data can all reference the same object.
+    """
+
+    progress: float
+    layer: int
+    total_layers: int
+    elapsed: int
+    remaining: int
+    filename: str
+    nozzle_temp: float
+    bed_temp: float
+    used_filament: int
+    image_url: str
+
+
+def _has_meaningful_change(
+    new: PrinterPayload, old: PrinterPayload | None
+) -> bool:
+    """Compare a payload against the last sent one using noise tolerances."""
+    if old is None:
+        return True
+    # The memoised payload is returned unchanged while no field moved.
+    if new is old:
+        return False
+    return (
+        abs(new.progress - old.progress) > 0.5
+        or abs(new.nozzle_temp - old.nozzle_temp) > 0.5
+        or abs(new.bed_temp - old.bed_temp) > 0.5
+        or abs(new.elapsed - old.elapsed) > 1
+        or abs(new.remaining - old.remaining) > 1
+        or abs(new.used_filament - old.used_filament) > 1
+        or abs(new.layer - old.layer) > 1
+        or abs(new.total_layers - old.total_layers) > 1
+        or new.filename != old.filename
+        or new.image_url != old.image_url
+    )
+
+
+class EnderStateCoordinator(DataUpdateCoordinator[PrinterPayload | None]):
+    """Push-only coordinator backing the Ender V3KE sensors.
+
+    Data arrives exclusively through ``async_set_updated_data`` from the
+    WebSocket bridge, so no refresh timer is ever scheduled.
+    """
 
     def __init__(self, hass: HomeAssistant) -> None:
         super().__init__(
             hass,
             _LOGGER,
             name="Ender V3KE state",
-            update_method=self._async_empty_update,
+            update_interval=None,
         )
 
-    async def _async_empty_update(self) -> dict[str, Any]:
-        return self.data or {}
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Never schedule polling; updates are pushed by the bridge."""
+
+    async def _async_update_data(self) -> PrinterPayload | None:
+        # Manual refresh requests (e.g. homeassistant.update_entity) keep the
+        # last pushed state.
+        return self.data
 
 
 class EnderBridge:
@@ -121,86 +232,83 @@ class EnderBridge:
         self.entry = entry
         self.coordinator = coordinator
         self._task: asyncio.Task | None = None
+        self._publish_task: asyncio.Task | None = None
         self._stop_event = asyncio.Event()
+        self._retries: int = 0
+        self._publish_event = asyncio.Event()
+        self._pending_payload: PrinterPayload | None = None
         self._cached_state: dict[str, Any] = {}
-        self._last_sent_state: dict[str, Any] = {}
+        self._cached_state_version: int = 0
+        self._sanitised_cache: tuple[int, PrinterPayload] | None = None
+        self._last_sent_payload: PrinterPayload | None = None
         self._last_sent_time: float = 0
         self._current_filename: str | None = None
+        self._cached_basename: str = ""
+        self._image_etag: str | None = None
+        self._image_last_modified: str | None = None
         self._session = async_get_clientsession(hass)
+        self._ws_connect = websockets.connect
+        self._load_config()
 
-    @property
-    def mqtt_topic(self) -> str:
-        return self.entry.data.get(CONF_MQTT_TOPIC, DEFAULT_MQTT_TOPIC)
-
-    @property
-    def publish_interval(self) -> float:
+    def _load_config(self) -> None:
+        """Snapshot the entry configuration into plain attributes."""
+        data = self.entry.data
+        self.mqtt_topic: str = data.get(CONF_MQTT_TOPIC, DEFAULT_MQTT_TOPIC)
         interval = _safe_float(
-            self.entry.data.get(CONF_PUBLISH_INTERVAL, DEFAULT_PUBLISH_INTERVAL),
+            data.get(CONF_PUBLISH_INTERVAL, DEFAULT_PUBLISH_INTERVAL),
             DEFAULT_PUBLISH_INTERVAL,
         )
-        return interval if interval > 0 else DEFAULT_PUBLISH_INTERVAL
-
-    @property
-    def snapshot_url(self) -> str:
-        return self.entry.data.get(CONF_SNAPSHOT_URL) or self.entry.options.get(
+        self.publish_interval: float = (
+            interval if interval > 0 else DEFAULT_PUBLISH_INTERVAL
+        )
+        self.snapshot_url: str = data.get(CONF_SNAPSHOT_URL) or self.entry.options.get(
             CONF_SNAPSHOT_URL, ""
         )
-
-    @property
-    def ws_url(self) -> str:
-        return self.entry.data.get(CONF_WS_URL, "")
-
-    @property
-    def local_image_path(self) -> str:
-        return self.entry.data.get(CONF_LOCAL_IMAGE_PATH, DEFAULT_LOCAL_IMAGE_PATH)
-
-    @property
-    def exposed_image_path(self) -> str:
-        return self.entry.data.get(
+        self.ws_url: str = data.get(CONF_WS_URL, "")
+        self.local_image_path: str = data.get(
+            CONF_LOCAL_IMAGE_PATH, DEFAULT_LOCAL_IMAGE_PATH
+        )
+        self.exposed_image_path: str = data.get(
             CONF_EXPOSED_IMAGE_PATH, DEFAULT_EXPOSED_IMAGE_PATH
         )
-
-    @property
-    def max_image_bytes(self) -> int:
         size = _safe_int(
-            self.entry.data.get(CONF_MAX_IMAGE_BYTES, DEFAULT_MAX_IMAGE_BYTES),
+            data.get(CONF_MAX_IMAGE_BYTES, DEFAULT_MAX_IMAGE_BYTES),
             DEFAULT_MAX_IMAGE_BYTES,
         )
-        return size if size > 0 else DEFAULT_MAX_IMAGE_BYTES
-
-    @property
-    def mqtt_enabled(self) -> bool:
-        return bool(self.entry.data.get(CONF_ENABLE_MQTT, True))
+        self.max_image_bytes: int = size if size > 0 else DEFAULT_MAX_IMAGE_BYTES
+        self.mqtt_enabled: bool = bool(data.get(CONF_ENABLE_MQTT, True))
 
     async def async_start(self) -> None:
         if self._task and not self._task.done():
             return
         self._stop_event.clear()
         self._task = asyncio.create_task(self._run())
+        if self.mqtt_enabled:
+            self._publish_task = asyncio.create_task(self._publish_loop())
 
     async def async_stop(self) -> None:
         self._stop_event.set()
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._task, self._publish_task):
+            if task:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
 
     async def _run(self) -> None:
-        backoff = 1
+        backoff = WS_RECONNECT_MIN_DELAY
         while not self._stop_event.is_set():
             try:
-                import websockets
-
-                async with websockets.connect(
+                # Frames are small JSON documents; per-message deflate only costs CPU.
+                async with self._ws_connect(
                     self.ws_url,
                     ping_interval=20,
                     ping_timeout=20,
                     max_size=2**20,
+                    compression=None,
                 ) as ws:
                     _LOGGER.info("WebSocket connected to %s", self.ws_url)
-                    backoff = 1
+                    backoff = WS_RECONNECT_MIN_DELAY
+                    self._retries = 0
                     async for msg in ws:
                         if self._stop_event.is_set():
                             break
@@ -208,16 +316,40 @@ class EnderBridge:
             except asyncio.CancelledError:
                 break
             except Exception as err:  # noqa: BLE001 - log unexpected errors
-                _LOGGER.error("WebSocket error: %s", err)
+                # Only the first failure of an outage is worth an error entry.
+                if self._retries == 0:
+                    _LOGGER.error("WebSocket error: %s", err)
+                else:
+                    _LOGGER.debug("WebSocket error: %s", err)
             if self._stop_event.is_set():
                 break
-            _LOGGER.info("Reconnecting in %ss…", backoff)
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, 60)
-
-    async def _handle_message(self, msg: str) -> None:
+            self._retries += 1
+            if self._retries >= WS_RECONNECT_MAX_RETRIES:
+                _LOGGER.warning(
+                    "WebSocket unreachable after %s attempts; retrying in %ss",
+                    self._retries,
+                    WS_RECONNECT_COOLDOWN,
+                )
+                self.coordinator.async_set_update_error(
+                    ConnectionError(f"Unable to reach printer at {self.ws_url}")
+                )
+                await asyncio.sleep(WS_RECONNECT_COOLDOWN)
+                self._retries = 0
+                backoff = WS_RECONNECT_MIN_DELAY
+                continue
+            delay = backoff + random.uniform(0, WS_RECONNECT_JITTER)
+            _LOGGER.debug("Reconnecting in %.1fs…", delay)
+            await asyncio.sleep(delay)
+            backoff = min(backoff * 1.5, WS_RECONNECT_MAX_DELAY)
+
+    async def _handle_message(self, msg: str | bytes) -> None:
+        needles = (
+            _PRINTER_KEY_NEEDLES if isinstance(msg, str) else _PRINTER_KEY_NEEDLES_BYTES
+        )
+        if not any(needle in msg for needle in needles):
+            return
         try:
-            data = json.loads(msg)
+            data = _json_loads(msg)
         except json.JSONDecodeError:
             _LOGGER.debug("Ignoring non-JSON message: %s", msg)
             return
@@ -227,10 +359,11 @@ class EnderBridge:
 
         payload = await self._extract_data(data)
         now = time.monotonic()
-        if self._has_meaningful_change(payload, self._last_sent_state):
+        if _has_meaningful_change(payload, self._last_sent_payload):
             if self.mqtt_enabled:
-                await self._async_publish(payload)
-            self._last_sent_state = payload.copy()
+                self._pending_payload = payload
+                self._publish_event.set()
+            self._last_sent_payload = payload
             self._last_sent_time = now
             self.coordinator.async_set_updated_data(payload)
         elif (now - self._last_sent_time) >= self.publish_interval:
@@ -238,17 +371,41 @@ class EnderBridge:
             self._last_sent_time = now
             self.coordinator.async_set_updated_data(payload)
 
-    async def _async_publish(self, payload: dict[str, Any]) -> None:
+    async def _publish_loop(self) -> None:
+        # Coalesce bursts of changes into one MQTT publish per interval,
+        # always sending the most recent payload.
+        while not self._stop_event.is_set():
+            await self._publish_event.wait()
+            await asyncio.sleep(self.publish_interval)
+            self._publish_event.clear()
+            payload, self._pending_payload = self._pending_payload, None
+            if payload is None:
+                continue
+            try:
+                await self._async_publish(payload)
+            except Exception:  # noqa: BLE001 - keep the publish loop alive
+                _LOGGER.exception("Unexpected error publishing MQTT payload")
+
+    async def _async_publish(self, payload: PrinterPayload) -> None:
         if mqtt.DOMAIN not in self.hass.config.components:
             _LOGGER.debug("MQTT integration not loaded; skipping publish")
             return
+        # _safe_int keeps every integer within orjson's 64-bit range.
+        encoded = _json_dumps(payload)
         try:
-            await mqtt.async_publish(self.hass, self.mqtt_topic, json.dumps(payload))
-            _LOGGER.info("Published MQTT payload to %s", self.mqtt_topic)
-        except Exception as exc:  # noqa: BLE001
+            await mqtt.async_publish(self.hass, self.mqtt_topic, encoded)
+        except HomeAssistantError as exc:
             _LOGGER.warning("Failed to publish MQTT payload: %s", exc)
+            return
+        _LOGGER.info("Published MQTT payload to %s", self.mqtt_topic)
 
-    def _sanitise_payload(self, state: dict[str, Any]) -> dict[str, Any]:
+    def _sanitise_payload(self) -> PrinterPayload:
+        """Return the payload for the cached state, rebuilt only when it changed."""
+        cached = self._sanitised_cache
+        if cached is not None and cached[0] == self._cached_state_version:
+            return cached[1]
+
+        state = self._cached_state
         progress = _clamp(_safe_float(state.get("printProgress"), 0.0), 0.0, 100.0)
         layer = _safe_int(state.get("layer"), 0)
         total_layers = max(layer, _safe_int(state.get("TotalLayer"), 0))
@@ -257,59 +414,68 @@ class EnderBridge:
         nozzle_temp = _safe_float(state.get("nozzleTemp"), 0.0)
         bed_temp = _safe_float(state.get("bedTemp0"), 0.0)
         used_filament = max(0, _safe_int(state.get("usedMaterialLength"), 0))
-        filename = os.path.basename(_safe_str(state.get("printFileName", "")))
-
-        return {
-            "progress": progress,
-            "layer": layer,
-            "total_layers": total_layers,
-            "elapsed": elapsed,
-            "remaining": remaining,
-            "filename": filename,
-            "nozzle_temp": nozzle_temp,
-            "bed_temp": bed_temp,
-            "used_filament": used_filament,
-            "image_url": self.exposed_image_path,
-        }
-
-    async def _extract_data(self, data: dict[str, Any]) -> dict[str, Any]:
-        for key in (
-            "printProgress",
-            "layer",
-            "TotalLayer",
-            "printJobTime",
-            "printLeftTime",
-            "printFileName",
-            "nozzleTemp",
-            "bedTemp0",
-            "usedMaterialLength",
-        ):
-            if key in data:
-                self._cached_state[key] = data[key]
+        filename = self._cached_basename
+
+        payload = PrinterPayload(
+            progress=progress,
+            layer=layer,
+            total_layers=total_layers,
+            elapsed=elapsed,
+            remaining=remaining,
+            filename=filename,
+            nozzle_temp=nozzle_temp,
+            bed_temp=bed_temp,
+            used_filament=used_filament,
+            image_url=self.exposed_image_path,
+        )
+        self._sanitised_cache = (self._cached_state_version, payload)
+        return payload
+
+    async def _extract_data(self, data: dict[str, Any]) -> PrinterPayload:
+        cache = self._cached_state
+        changed = False
+        for key, value in data.items():
+            if key in _PRINTER_KEY_SET:
+                if key not in cache or cache[key] != value:
+                    cache[key] = value
+                    changed = True
+                    if key == "printFileName":
+                        self._cached_basename = os.path.basename(_safe_str(value))
+        if changed:
+            self._cached_state_version += 1
 
         if _safe_float(data.get("printProgress"), 1.0) == 0:
             self._current_filename = None
 
-        filename = os.path.basename(_safe_str(self._cached_state.get("printFileName", "")))
+        filename = self._cached_basename
         if filename and filename != self._current_filename:
             self._current_filename = filename
             await self._async_download_image()
 
-        return self._sanitise_payload(self._cached_state)
+        return self._sanitise_payload()
 
     async def _async_download_image(self) -> None:
         if not self.snapshot_url:
             return
         target_path = self.hass.config.path(self.local_image_path)
-        os.makedirs(os.path.dirname(target_path), exist_ok=True)
-        tmp_path = f"{target_path}.tmp"
+
+        headers = {"Accept": "image/*"}
+        # Only revalidate while the previous snapshot is still on disk.
+        if await self.hass.async_add_executor_job(os.path.exists, target_path):
+            if self._image_etag:
+                headers["If-None-Match"] = self._image_etag
+            if self._image_last_modified:
+                headers["If-Modified-Since"] = self._image_last_modified
 
         try:
             async with self._session.get(
                 self.snapshot_url,
                 timeout=5,
-                headers={"Accept": "image/*"},
+                headers=headers,
             ) as resp:
+                if resp.status == 304:
+                    _LOGGER.debug("Snapshot unchanged; keeping existing image.")
+                    return
                 if resp.status != 200:
                     _LOGGER.warning("Image request returned HTTP %s", resp.status)
                     return
@@ -318,27 +484,40 @@ class EnderBridge:
                     _LOGGER.warning("Unexpected image Content-Type '%s'; aborting download.", content_type or "<missing>")
                     return
 
+                max_bytes = self.max_image_bytes
+                if resp.content_length is not None and resp.content_length > max_bytes:
+                    _LOGGER.warning(
+                        "Image of %s bytes exceeds %s bytes; skipping download.",
+                        resp.content_length,
+                        max_bytes,
+                    )
+                    return
+
+                # Collect the body into one preallocated buffer and write it once.
+                buffer = bytearray(resp.content_length or max_bytes)
+                view = memoryview(buffer)
                 bytes_written = 0
-                over_limit = False
-                with open(tmp_path, "wb") as f:
-                    async for chunk in resp.content.iter_chunked(IMAGE_CHUNK_BYTES):
-                        if not chunk:
-                            continue
-                        bytes_written += len(chunk)
-                        if bytes_written > self.max_image_bytes:
+                while chunk := await resp.content.readany():
+                    end = bytes_written + len(chunk)
+                    if end > len(buffer):
+                        if end > max_bytes:
                             _LOGGER.warning(
                                 "Image exceeded %s bytes; discarding partial download.",
-                                self.max_image_bytes,
+                                max_bytes,
                             )
-                            over_limit = True
-                            break
-                        f.write(chunk)
-
-                if over_limit:
-                    os.remove(tmp_path)
-                    return
-
-                os.replace(tmp_path, target_path)
+                            return
+                        # Content-Length undercounted the body; grow to the cap.
+                        view.release()
+                        buffer.extend(bytes(max_bytes - len(buffer)))
+                        view = memoryview(buffer)
+                    view[bytes_written:end] = chunk
+                    bytes_written = end
+
+                await self.hass.async_add_executor_job(
+                    self._write_image, target_path, view[:bytes_written]
+                )
+                self._image_etag = resp.headers.get("ETag")
+                self._image_last_modified = resp.headers.get("Last-Modified")
                 _LOGGER.info("Image downloaded and saved (%s bytes).", bytes_written)
         except FileNotFoundError:
             _LOGGER.warning("Local image path directory missing: %s", target_path)
@@ -349,41 +528,21 @@ class EnderBridge:
         except Exception as exc:  # noqa: BLE001
             _LOGGER.warning("Unexpected error downloading image: %s", exc)
 
-    def _has_meaningful_change(self, new: dict[str, Any], old: dict[str, Any]) -> bool:
-        if not old:
-            return True
-
-        numeric_tolerances = {
-            "progress": 0.5,
-            "nozzle_temp": 0.5,
-            "bed_temp": 0.5,
-            "elapsed": 1,
-            "remaining": 1,
-            "used_filament": 1,
-            "layer": 1,
-            "total_layers": 1,
-        }
-
-        for key, value in new.items():
-            if key not in old:
-                return True
-            other = old[key]
-            if isinstance(value, (int, float)) and isinstance(other, (int, float)):
-                tolerance = numeric_tolerances.get(key, 0)
-                if abs(float(value) - float(other)) > tolerance:
-                    return True
-            elif value != other:
-                return True
-
-        for key in old:
-            if key not in new:
-                return True
-
-        return False
+    @staticmethod
+    def _write_image(target_path: str, data: memoryview) -> None:
+        """Atomically replace the snapshot file; runs in the executor."""
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        tmp_path = f"{target_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, target_path)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up the integration from a config entry."""
+    if websockets is None:
+        raise ConfigEntryNotReady("The websockets package is not installed")
+
     coordinator = EnderStateCoordinator(hass)
     bridge = EnderBridge(hass, entry, coordinator)
 
@@ -397,10 +556,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except Exception as exc:  # noqa: BLE001
         raise ConfigEntryNotReady(f"Failed to start Ender V3KE bridge: {exc}") from exc
 
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry so every configuration change takes effect."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     data = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
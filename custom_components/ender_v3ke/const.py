@@ -24,4 +24,9 @@ DEFAULT_LOCAL_IMAGE_PATH = "www/ender_v3ke/print.png"
 DEFAULT_EXPOSED_IMAGE_PATH = "/local/ender_v3ke/print.png"
 
 IMAGE_ALLOWED_CONTENT_TYPES = {"image/png", "image/jpeg", "image/jpg"}
-IMAGE_CHUNK_BYTES = 64 * 1024
+
+WS_RECONNECT_MIN_DELAY = 0.2
+WS_RECONNECT_MAX_DELAY = 1.0
+WS_RECONNECT_JITTER = 0.2
+WS_RECONNECT_MAX_RETRIES = 120
+WS_RECONNECT_COOLDOWN = 60
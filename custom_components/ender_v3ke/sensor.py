@@ -16,6 +16,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from . import PrinterPayload
 from .const import DOMAIN
 
 
@@ -23,7 +24,7 @@ from .const import DOMAIN
 class EnderSensorEntityDescription(SensorEntityDescription):
     """Describe an Ender V3KE sensor."""
 
-    value_fn: Callable[[dict[str, Any]], Any] | None = None
+    value_fn: Callable[[PrinterPayload], Any] | None = None
 
 
 SENSOR_DESCRIPTIONS: tuple[EnderSensorEntityDescription, ...] = (
@@ -31,53 +32,53 @@ SENSOR_DESCRIPTIONS: tuple[EnderSensorEntityDescription, ...] = (
         key="progress",
         name="Print Progress",
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda data: data.get("progress"),
+        value_fn=lambda data: data.progress,
         suggested_display_precision=1,
     ),
     EnderSensorEntityDescription(
         key="layer",
         name="Current Layer",
-        value_fn=lambda data: data.get("layer"),
+        value_fn=lambda data: data.layer,
     ),
     EnderSensorEntityDescription(
         key="total_layers",
         name="Total Layers",
-        value_fn=lambda data: data.get("total_layers"),
+        value_fn=lambda data: data.total_layers,
     ),
     EnderSensorEntityDescription(
         key="elapsed",
         name="Elapsed Print Time",
         native_unit_of_measurement=UnitOfTime.SECONDS,
         suggested_display_precision=0,
-        value_fn=lambda data: data.get("elapsed"),
+        value_fn=lambda data: data.elapsed,
     ),
     EnderSensorEntityDescription(
         key="remaining",
         name="Remaining Print Time",
         native_unit_of_measurement=UnitOfTime.SECONDS,
         suggested_display_precision=0,
-        value_fn=lambda data: data.get("remaining"),
+        value_fn=lambda data: data.remaining,
     ),
     EnderSensorEntityDescription(
         key="nozzle_temp",
         name="Nozzle Temperature",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_display_precision=1,
-        value_fn=lambda data: data.get("nozzle_temp"),
+        value_fn=lambda data: data.nozzle_temp,
     ),
     EnderSensorEntityDescription(
         key="bed_temp",
         name="Bed Temperature",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_display_precision=1,
-        value_fn=lambda data: data.get("bed_temp"),
+        value_fn=lambda data: data.bed_temp,
     ),
     EnderSensorEntityDescription(
         key="used_filament",
         name="Used Filament Length",
         native_unit_of_measurement=UnitOfLength.MILLIMETERS,
         suggested_display_precision=0,
-        value_fn=lambda data: data.get("used_filament"),
+        value_fn=lambda data: data.used_filament,
     ),
 )
 
@@ -113,10 +114,12 @@ class EnderSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self):
-        data = self.coordinator.data or {}
+        data = self.coordinator.data
+        if data is None:
+            return None
         if self.entity_description.value_fn:
             return self.entity_description.value_fn(data)
-        return data.get(self.entity_description.key)
+        return getattr(data, self.entity_description.key, None)
 
     @property
     def device_info(self):
@@ -129,9 +132,11 @@ class EnderSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def extra_state_attributes(self):
-        data = self.coordinator.data or {}
-        filename = data.get("filename")
-        image_url = data.get("image_url")
+        data = self.coordinator.data
+        if data is None:
+            return None
+        filename = data.filename
+        image_url = data.image_url
         attrs = {}
         if filename:
             attrs["filename"] = filename
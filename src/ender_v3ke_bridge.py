@@ -1,15 +1,31 @@
 import asyncio
-import json
 import logging
 import math
 import os
-import time
+import queue
+import socket
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict
 
-import requests
+import aiohttp
+import orjson
 import websockets
 import paho.mqtt.client as mqtt
 
+try:
+    import uvloop
+except ImportError:  # optional; the stdlib loop works everywhere
+    uvloop = None
+
+try:
+    # websockets >= 13 can return text frames as raw bytes, skipping the UTF-8
+    # decode that orjson would otherwise redo.
+    from websockets.asyncio.client import connect as ws_connect
+    WS_RECV_KWARGS = {"decode": False}
+except ImportError:
+    from websockets import connect as ws_connect
+    WS_RECV_KWARGS = {}
+
 
 def load_env_file(filepath: str = ".env") -> None:
     """Populate os.environ with key=value pairs from a simple .env file."""
@@ -54,121 +70,165 @@ TMP_IMAGE_PATH    = LOCAL_IMAGE_PATH + ".tmp"
 EXPOSED_IMAGE_PATH = os.getenv("EXPOSED_IMAGE_PATH", "/local/images/3dprint.png")
 MAX_IMAGE_BYTES   = int(os.getenv("MAX_IMAGE_BYTES", 5 * 1024 * 1024))
 IMAGE_ALLOWED_CONTENT_TYPES = {"image/png", "image/jpeg", "image/jpg"}
-IMAGE_CHUNK_BYTES = 64 * 1024
-
-# Ensure the HA images folder exists
-os.makedirs(os.path.dirname(LOCAL_IMAGE_PATH), exist_ok=True)
+IMAGE_CHUNK_BYTES = 128 * 1024
+INF               = math.inf
+INT64_MIN         = -(2 ** 63)
+INT64_MAX         = 2 ** 63 - 1
+
+# Printer telemetry keys merged into cached_state
+WANTED_KEYS = frozenset((
+    "printProgress",
+    "layer",
+    "TotalLayer",
+    "printJobTime",
+    "printLeftTime",
+    "printFileName",
+    "nozzleTemp",
+    "bedTemp0",
+    "usedMaterialLength",
+))
 
-# Setup logging
 LOG_FILE = os.getenv("LOG_FILE", "v3kepull.log")
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s: %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
-
-
-if PUBLISH_INTERVAL <= 0:
-    logging.warning("PUBLISH_INTERVAL must be positive. Falling back to 2 seconds.")
-    PUBLISH_INTERVAL = 2
-
-if MAX_IMAGE_BYTES <= 0:
-    logging.warning("MAX_IMAGE_BYTES must be positive. Falling back to 5 MiB.")
-    MAX_IMAGE_BYTES = 5 * 1024 * 1024
+log = logging.getLogger(__name__)
 
 # MQTT callbacks
-def on_connect(client, userdata, flags, rc):
+def on_connect(client, userdata, flags, rc, properties=None):
     if rc == 0:
-        logging.info("Connected to MQTT broker.")
+        log.info("Connected to MQTT broker.")
+        # Small telemetry publishes should not wait on Nagle's algorithm
+        sock = client.socket()
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError as exc:
+                log.debug("Unable to set TCP_NODELAY on MQTT socket: %s", exc)
     else:
-        logging.error(f"Failed to connect to MQTT broker, return code {rc}")
-
-def on_disconnect(client, userdata, rc):
-    logging.warning(f"Disconnected from MQTT broker (rc={rc}), will attempt to reconnect.")
-
-# Initialize MQTT client
-mqtt_client = mqtt.Client()
-if MQTT_USER and MQTT_PASS:
-    mqtt_client.username_pw_set(MQTT_USER, MQTT_PASS)
-elif MQTT_USER or MQTT_PASS:
-    logging.warning("Both MQTT_USER and MQTT_PASS are required for authenticated connections; proceeding without auth.")
-else:
-    logging.warning("No MQTT credentials supplied; connecting without authentication.")
-mqtt_client.on_connect = on_connect
-mqtt_client.on_disconnect = on_disconnect
-
-if MQTT_USE_TLS:
-    mqtt_client.tls_set()
-    if MQTT_TLS_INSECURE:
-        mqtt_client.tls_insecure_set(True)
-try:
-    mqtt_client.connect(MQTT_BROKER, MQTT_PORT, keepalive=60)
-    mqtt_client.loop_start()
-except Exception as e:
-    logging.error(f"Initial MQTT connection failed: {e}")
+        log.error("Failed to connect to MQTT broker, return code %s", rc)
+
+def on_disconnect(client, userdata, rc, properties=None):
+    log.warning("Disconnected from MQTT broker (rc=%s), will attempt to reconnect.", rc)
+
+mqtt_client = mqtt.Client(protocol=mqtt.MQTTv5)
 
 # State caches
 cached_state    = {}
 last_sent_state = {}
-last_sent_time  = time.monotonic() - PUBLISH_INTERVAL
+last_sent_bytes = b""
 current_filename = None
+download_task    = None
+image_session: aiohttp.ClientSession | None = None
+log_listener: QueueListener | None = None
+
+
+def _init() -> None:
+    """Set up logging, the image folder and the MQTT connection.
+
+    Kept out of module scope so importing the bridge has no side effects.
+    """
+    global PUBLISH_INTERVAL, MAX_IMAGE_BYTES, log_listener
 
-def download_image():
+    # Setup logging: records are queued and written by a background thread,
+    # keeping file and console I/O off the event loop.
+    log_queue = queue.SimpleQueue()
+    log_listener = QueueListener(
+        log_queue,
+        logging.FileHandler(LOG_FILE),
+        logging.StreamHandler(),
+        respect_handler_level=True,
+    )
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s: %(message)s",
+        handlers=[QueueHandler(log_queue)]
+    )
+    log_listener.start()
+
+    # Ensure the HA images folder exists
+    os.makedirs(os.path.dirname(LOCAL_IMAGE_PATH), exist_ok=True)
+
+    if PUBLISH_INTERVAL <= 0:
+        log.warning("PUBLISH_INTERVAL must be positive. Falling back to 2 seconds.")
+        PUBLISH_INTERVAL = 2
+
+    if MAX_IMAGE_BYTES <= 0:
+        log.warning("MAX_IMAGE_BYTES must be positive. Falling back to 5 MiB.")
+        MAX_IMAGE_BYTES = 5 * 1024 * 1024
+
+    # Initialize MQTT client
+    if MQTT_USER and MQTT_PASS:
+        mqtt_client.username_pw_set(MQTT_USER, MQTT_PASS)
+    elif MQTT_USER or MQTT_PASS:
+        log.warning("Both MQTT_USER and MQTT_PASS are required for authenticated connections; proceeding without auth.")
+    else:
+        log.warning("No MQTT credentials supplied; connecting without authentication.")
+    mqtt_client.on_connect = on_connect
+    mqtt_client.on_disconnect = on_disconnect
+
+    if MQTT_USE_TLS:
+        mqtt_client.tls_set()
+        if MQTT_TLS_INSECURE:
+            mqtt_client.tls_insecure_set(True)
+    try:
+        mqtt_client.connect(MQTT_BROKER, MQTT_PORT, keepalive=60)
+        mqtt_client.loop_start()
+    except Exception as e:
+        log.error("Initial MQTT connection failed: %s", e)
+
+
+def write_image(data: bytes) -> None:
+    """Write the snapshot to a temp file and atomically swap it into place."""
+    with open(TMP_IMAGE_PATH, "wb") as f:
+        f.write(data)
+    os.replace(TMP_IMAGE_PATH, LOCAL_IMAGE_PATH)
+
+
+async def download_image():
     """Download the printer snapshot safely and write it atomically."""
     try:
-        resp = requests.get(
+        async with image_session.get(
             IMAGE_URL,
-            timeout=5,
-            stream=True,
             headers={"Accept": "image/*"},
-        )
-        with resp:
-            if resp.status_code != 200:
-                logging.warning(f"Image request returned HTTP {resp.status_code}")
+        ) as resp:
+            if resp.status != 200:
+                log.warning("Image request returned HTTP %s", resp.status)
                 return
 
             content_type = resp.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
             if content_type and content_type not in IMAGE_ALLOWED_CONTENT_TYPES:
-                logging.warning(
+                log.warning(
                     "Unexpected image Content-Type '%s'; aborting download.",
                     content_type or "<missing>",
                 )
                 return
 
-            bytes_written = 0
-            over_limit = False
-            with open(TMP_IMAGE_PATH, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=IMAGE_CHUNK_BYTES):
-                    if not chunk:
-                        continue
-                    bytes_written += len(chunk)
-                    if bytes_written > MAX_IMAGE_BYTES:
-                        logging.warning(
-                            "Image exceeded %s bytes; discarding partial download.",
-                            MAX_IMAGE_BYTES,
-                        )
-                        over_limit = True
-                        break
-                    f.write(chunk)
-
-            if over_limit:
-                try:
-                    os.remove(TMP_IMAGE_PATH)
-                except FileNotFoundError:
-                    pass
-                return
-
-            os.replace(TMP_IMAGE_PATH, LOCAL_IMAGE_PATH)
-            logging.info("Image downloaded and saved (%s bytes).", bytes_written)
+            data = bytearray()
+            async for chunk in resp.content.iter_chunked(IMAGE_CHUNK_BYTES):
+                data += chunk
+                if len(data) > MAX_IMAGE_BYTES:
+                    log.warning(
+                        "Image exceeded %s bytes; discarding partial download.",
+                        MAX_IMAGE_BYTES,
+                    )
+                    return
+
+        # Keep disk I/O off the event loop
+        await asyncio.to_thread(write_image, data)
+        log.info("Image downloaded and saved (%s bytes).", len(data))
     except PermissionError:
-        logging.warning("Permission denied writing image file. Check folder ownership.")
-    except requests.RequestException as exc:
-        logging.warning("Error downloading image: %s", exc)
+        log.warning("Permission denied writing image file. Check folder ownership.")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+        log.warning("Error downloading image: %s", exc)
     except Exception as e:
-        logging.warning(f"Unexpected error downloading image: {e}")
+        log.warning("Unexpected error downloading image: %s", e)
+
+
+def start_image_download() -> bool:
+    """Start download_image in the background; False if one is already running."""
+    global download_task
+    if download_task is not None and not download_task.done():
+        return False
+    download_task = asyncio.get_running_loop().create_task(download_image())
+    return True
 
 
 def safe_str(value: Any, default: str = "") -> str:
@@ -182,36 +242,39 @@ def safe_str(value: Any, default: str = "") -> str:
 
 
 def safe_float(value: Any, default: float = 0.0) -> float:
-    if value is None:
+    if type(value) is float:
+        result = value
+    elif value is None:
         return default
-    if isinstance(value, (int, float)):
-        result = float(value)
     else:
         try:
-            result = float(str(value).strip())
-        except (TypeError, ValueError):
+            result = float(value)
+        except (TypeError, ValueError, OverflowError):
             return default
-
-    if math.isnan(result) or math.isinf(result):
-        return default
-    return result
+    if result == result and -INF < result < INF:
+        return result
+    return default
 
 
 def safe_int(value: Any, default: int = 0) -> int:
-    if value is None:
-        return default
-    if isinstance(value, bool):
-        return default
-    if isinstance(value, int):
-        return value
-    if isinstance(value, float):
-        if math.isnan(value) or math.isinf(value):
+    # Values outside the signed 64-bit range cannot be encoded by orjson
+    value_type = type(value)
+    if value_type is int:
+        result = value
+    elif value_type is float:
+        if not (value == value and -INF < value < INF):
             return default
-        return int(value)
-    try:
-        return int(float(str(value).strip()))
-    except (TypeError, ValueError):
+        result = int(value)
+    elif value is None or value_type is bool:
         return default
+    else:
+        try:
+            result = int(float(value))
+        except (TypeError, ValueError, OverflowError):
+            return default
+    if INT64_MIN <= result <= INT64_MAX:
+        return result
+    return default
 
 
 def clamp(value: float, minimum: float, maximum: float) -> float:
@@ -227,7 +290,7 @@ def sanitise_payload(state: Dict[str, Any]) -> Dict[str, Any]:
     nozzle_temp = safe_float(state.get("nozzleTemp"), 0.0)
     bed_temp = safe_float(state.get("bedTemp0"), 0.0)
     used_filament = max(0, safe_int(state.get("usedMaterialLength"), 0))
-    filename = os.path.basename(safe_str(state.get("printFileName", "")))
+    filename = state.get("_filename", "")
 
     return {
         "progress": progress,
@@ -242,39 +305,34 @@ def sanitise_payload(state: Dict[str, Any]) -> Dict[str, Any]:
         "image_url": EXPOSED_IMAGE_PATH,
     }
 
-def extract_data(data: dict) -> dict:
-    """
-    Merge incoming data into cached_state, detect new print jobs,
-    download image once per job, and build the MQTT payload.
-    """
+def merge_state(data: dict) -> None:
+    """Merge the printer keys we care about into cached_state."""
     global current_filename
 
-    # Merge only the keys we care about
-    for key in (
-        "printProgress",
-        "layer",
-        "TotalLayer",
-        "printJobTime",
-        "printLeftTime",
-        "printFileName",
-        "nozzleTemp",
-        "bedTemp0",
-        "usedMaterialLength",
-    ):
-        if key in data:
-            cached_state[key] = data[key]
+    # Set intersection runs in C rather than probing each wanted key in turn
+    cached_state.update({key: data[key] for key in WANTED_KEYS.intersection(data)})
+    if "printFileName" in data:
+        # Private key: the basename is computed once per update, not per payload
+        cached_state["_filename"] = os.path.basename(safe_str(data["printFileName"]))
 
     # If a job just finished (progress back to zero), clear filename so next job triggers download
     if safe_float(data.get("printProgress"), 1.0) == 0:
         current_filename = None
 
+
+def extract_data() -> dict:
+    """
+    Detect new print jobs from cached_state, download the image once
+    per job, and build the MQTT payload.
+    """
+    global current_filename
+
     # Get base filename
-    filename = os.path.basename(safe_str(cached_state.get("printFileName", "")))
+    filename = cached_state.get("_filename", "")
 
-    # On new job start, grab image once
-    if filename and filename != current_filename:
+    # On new job start, grab image once (retried on a later tick if one is in flight)
+    if filename and filename != current_filename and start_image_download():
         current_filename = filename
-        download_image()
 
     return sanitise_payload(cached_state)
 
@@ -282,79 +340,108 @@ def has_meaningful_change(new: dict, old: dict) -> bool:
     if not old:
         return True
 
-    numeric_tolerances = {
-        "progress": 0.5,
-        "nozzle_temp": 0.5,
-        "bed_temp": 0.5,
-        "elapsed": 1,
-        "remaining": 1,
-        "used_filament": 1,
-        "layer": 1,
-        "total_layers": 1,
-    }
-
-    for key, value in new.items():
-        if key not in old:
-            return True
-        other = old[key]
-        if isinstance(value, (int, float)) and isinstance(other, (int, float)):
-            tolerance = numeric_tolerances.get(key, 0)
-            if abs(float(value) - float(other)) > tolerance:
-                return True
-        else:
-            if value != other:
-                return True
-
-    for key in old:
-        if key not in new:
-            return True
-
-    return False
+    # sanitise_payload always emits the same keys, so compare them directly:
+    # 0.5 tolerance for progress/temperatures, 1 for counters.
+    return (
+        abs(new["progress"] - old["progress"]) > 0.5
+        or abs(new["nozzle_temp"] - old["nozzle_temp"]) > 0.5
+        or abs(new["bed_temp"] - old["bed_temp"]) > 0.5
+        or abs(new["elapsed"] - old["elapsed"]) > 1
+        or abs(new["remaining"] - old["remaining"]) > 1
+        or abs(new["used_filament"] - old["used_filament"]) > 1
+        or abs(new["layer"] - old["layer"]) > 1
+        or abs(new["total_layers"] - old["total_layers"]) > 1
+        or new["filename"] != old["filename"]
+        or new["image_url"] != old["image_url"]
+    )
+
+async def publisher():
+    """Publish cached_state at most once per PUBLISH_INTERVAL."""
+    global last_sent_state, last_sent_bytes
+    while True:
+        await asyncio.sleep(PUBLISH_INTERVAL)
+        # Nothing merged yet: publishing zeros would overwrite the retained state
+        if not cached_state:
+            continue
+        try:
+            full = extract_data()
+            payload_bytes = orjson.dumps(full)
+            # Identical encodings skip the tolerance walk entirely
+            if payload_bytes != last_sent_bytes and has_meaningful_change(full, last_sent_state):
+                # Retained so subscribers get the last state on (re)connect
+                mqtt_client.publish(MQTT_TOPIC, payload_bytes, qos=0, retain=True)
+                log.info("Published: %s", full)
+                last_sent_state = full
+                last_sent_bytes = payload_bytes
+        except Exception as e:
+            log.error("Publish error: %s", e)
 
 async def listen_to_printer():
-    global last_sent_state, last_sent_time
     backoff = 1
     while True:
         try:
-            async with websockets.connect(
+            async with ws_connect(
                 WS_URL,
                 ping_interval=20,
                 ping_timeout=20,
                 max_size=2 ** 20,
+                compression=None,
             ) as ws:
-                logging.info("WebSocket connected.")
+                log.info("WebSocket connected.")
                 backoff = 1
                 while True:
-                    msg = await ws.recv()
+                    msg = await ws.recv(**WS_RECV_KWARGS)
                     try:
-                        data = json.loads(msg)
+                        data = orjson.loads(msg)
                         if not isinstance(data, dict):
-                            logging.debug("Ignoring non-dict payload: %s", data)
+                            log.debug("Ignoring non-dict payload: %s", data)
                             continue
-                        full = extract_data(data)
-
-                        now = time.monotonic()
-                        if (now - last_sent_time) >= PUBLISH_INTERVAL and has_meaningful_change(full, last_sent_state):
-                            mqtt_client.publish(MQTT_TOPIC, json.dumps(full))
-                            logging.info(f"Published: {full}")
-                            last_sent_state = full.copy()
-                            last_sent_time = now
-                    except json.JSONDecodeError:
-                        logging.warning(f"Received non-JSON WS message: {msg}")
+                        # Ingest only; publisher() builds and sends the payload
+                        merge_state(data)
+                    except orjson.JSONDecodeError:
+                        log.warning("Received non-JSON WS message: %s", msg)
                     except websockets.ConnectionClosedError as wc:
-                        logging.warning(f"WebSocket closed: {wc}")
+                        log.warning("WebSocket closed: %s", wc)
                         break
         except Exception as e:
-            logging.error(f"WebSocket error: {e}")
-        logging.info(f"Reconnecting in {backoff}s…")
+            log.error("WebSocket error: %s", e)
+        log.info("Reconnecting in %ss…", backoff)
         await asyncio.sleep(backoff)
         backoff = min(backoff * 2, 60)
 
-if __name__ == "__main__":
+async def run_bridge() -> None:
+    global image_session
+    # One keep-alive connection to the printer is reused for every snapshot
+    image_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=1),
+        timeout=aiohttp.ClientTimeout(total=5),
+    )
+    publisher_task = asyncio.create_task(publisher())
+    try:
+        await listen_to_printer()
+    finally:
+        publisher_task.cancel()
+        await image_session.close()
+
+def main() -> None:
+    _init()
     try:
-        asyncio.run(listen_to_printer())
+        if uvloop is not None and hasattr(uvloop, "run"):
+            uvloop.run(run_bridge())
+        elif uvloop is not None:
+            # uvloop.run() only exists in uvloop >= 0.18
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                runner.run(run_bridge())
+        else:
+            asyncio.run(run_bridge())
     except KeyboardInterrupt:
-        logging.info("Shutting down…")
+        log.info("Shutting down…")
     finally:
         mqtt_client.loop_stop()
         mqtt_client.disconnect()
+        if log_listener is not None:
+            log_listener.stop()
+
+
+if __name__ == "__main__":
+    main()